@@ -3,6 +3,8 @@ import shutil
 import zipfile
 import tarfile
 import stat
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Paths
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -25,6 +27,9 @@ LINUX_FILES = ["setup.sh", "start.sh"]
 WIN_UV = "uv.exe"
 LINUX_UV = "uv"
 
+# Write archives through a large buffer instead of the 8 KiB default
+ARCHIVE_BUFFER_SIZE = 1 << 20
+
 
 # Utility functions
 def clean_dir(path):
@@ -38,17 +43,114 @@ def copy_files(files, src_dir, dst_dir):
         shutil.copy(os.path.join(src_dir, f), os.path.join(dst_dir, f))
 
 
+def fast_copy(src, dst):
+    # Like shutil.copy, but lets the kernel move the bytes with
+    # copy_file_range where available and otherwise copies in 1 MiB chunks.
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+    shutil.copymode(src, dst)
+
+
+def link_or_copy(src, dst):
+    # Hardlink when source and destination share a filesystem (no data is
+    # moved); fall back to a real copy across devices or on unsupported FS.
+    try:
+        os.link(src, dst)
+    except OSError:
+        fast_copy(src, dst)
+
+
+def copy_tree(src_dir, dst_dir, workers=None):
+    # Create the directory skeleton up front, then copy files on a thread pool
+    # so per-file open/stat/close latency overlaps (shutil.copytree is serial).
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+    jobs = []
+
+    def walk(src, dst):
+        os.makedirs(dst, exist_ok=True)
+        with os.scandir(src) as it:
+            for entry in it:
+                target = os.path.join(dst, entry.name)
+                # Follow directory symlinks and copy their contents, as
+                # shutil.copytree does with symlinks=False
+                if entry.is_dir():
+                    walk(entry.path, target)
+                else:
+                    jobs.append((entry.path, target))
+
+    walk(src_dir, dst_dir)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(shutil.copy2, s, d) for s, d in jobs]:
+            future.result()
+
+
+def iter_files(root, prefix=""):
+    # Yield (absolute path, archive name) for every file below root. The
+    # DirEntry type comes from the directory listing, so no extra stat calls.
+    with os.scandir(root) as it:
+        for entry in it:
+            rel_path = prefix + entry.name
+            if entry.is_dir():
+                # Like os.walk: symlinked directories are not descended into,
+                # and they are not files either, so they are skipped entirely
+                if not entry.is_symlink():
+                    yield from iter_files(entry.path, rel_path + "/")
+            else:
+                yield entry.path, rel_path
+
+
 def make_zip(src_dir, out_file):
-    with zipfile.ZipFile(out_file, "w", zipfile.ZIP_DEFLATED) as zf:
-        for root, _, files in os.walk(src_dir):
-            for file in files:
-                abs_path = os.path.join(root, file)
-                rel_path = os.path.relpath(abs_path, src_dir)
-                zf.write(abs_path, rel_path)
+    with open(out_file, "wb", buffering=ARCHIVE_BUFFER_SIZE) as raw, zipfile.ZipFile(
+        raw, "w", zipfile.ZIP_DEFLATED, allowZip64=True
+    ) as zf:
+        for abs_path, rel_path in iter_files(src_dir):
+            zf.write(abs_path, rel_path)
 
 
 def make_tar(src_dir, out_file):
-    with tarfile.open(out_file, "w:gz") as tar:
+    # Prefer the system tar (with multi-threaded pigz when installed) and fall
+    # back to tarfile if tar is missing or fails.
+    tar_exe = shutil.which("tar")
+    if tar_exe:
+        parent, name = os.path.split(src_dir)
+        pigz = shutil.which("pigz")
+        compress = [f"--use-compress-program={pigz}"] if pigz else ["-z"]
+        # GNU tar reads an archive name containing a colon (C:\...) as a
+        # remote host:path; --force-local turns that off. bsdtar lacks the flag.
+        version = subprocess.run(
+            [tar_exe, "--version"], capture_output=True, text=True
+        ).stdout
+        force_local = ["--force-local"] if "GNU tar" in version else []
+        result = subprocess.run(
+            [tar_exe, *compress, *force_local, "-cf", out_file, "-C", parent, name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if result.returncode == 0:
+            return
+        print(
+            f"tar exited with code {result.returncode}, falling back to tarfile:\n"
+            f"{result.stderr.strip()}"
+        )
+        # Do not let tarfile append to or keep a partial archive from tar
+        if os.path.exists(out_file):
+            os.remove(out_file)
+    with open(out_file, "wb", buffering=ARCHIVE_BUFFER_SIZE) as raw, tarfile.open(
+        fileobj=raw, mode="w:gz", compresslevel=6
+    ) as tar:
         tar.add(src_dir, arcname=os.path.basename(src_dir))
 
 
@@ -58,8 +160,7 @@ def set_executable(path):
 
 
 def prepare_release(platform):
-    if not os.path.exists(BUILD_DIR):
-        os.makedirs(BUILD_DIR)
+    os.makedirs(BUILD_DIR, exist_ok=True)
     if platform == "win":
         release_dir = RELEASE_WIN
         files = WIN_FILES
@@ -81,35 +182,34 @@ def prepare_release(platform):
     os.makedirs(bin_dir, exist_ok=True)
     uv_src = os.path.join(SCRIPTS_DIR, uv_binary)
     uv_dst = os.path.join(bin_dir, uv_binary)
-    shutil.copy(uv_src, uv_dst)
+    fast_copy(uv_src, uv_dst)
     
     # Copy config and docs
     if os.path.exists(CONFIG_DIR):
-        shutil.copytree(CONFIG_DIR, os.path.join(release_dir, "config"))
+        copy_tree(CONFIG_DIR, os.path.join(release_dir, "config"))
     
     # Create docs directory for documentation
     docs_dir = os.path.join(release_dir, "docs")
     os.makedirs(docs_dir, exist_ok=True)
     
-    if os.path.exists(README):
-        shutil.copy(README, os.path.join(docs_dir, "ReadMe.md"))
-    if os.path.exists(LICENSE):
-        shutil.copy(LICENSE, os.path.join(docs_dir, "LICENSE"))
-    if os.path.exists(DEBUGGING):
-        shutil.copy(DEBUGGING, os.path.join(docs_dir, "DEBUGGING.md"))
+    for src, name in ((README, "ReadMe.md"), (LICENSE, "LICENSE"), (DEBUGGING, "DEBUGGING.md")):
+        if os.path.exists(src):
+            link_or_copy(src, os.path.join(docs_dir, name))
     
     # Create simple INSTALL.txt in root
     install_txt = os.path.join(release_dir, "INSTALL.txt")
+    if platform == "win":
+        steps = ["1. Run: setup.bat\n", "2. Start: start.bat\n\n"]
+    else:
+        steps = ["1. Run: ./setup.sh\n", "2. Start: ./start.sh\n\n"]
+    lines = [
+        "BioBeamer Launcher Installation\n",
+        "===============================\n\n",
+        *steps,
+        "For more details, see docs/ReadMe.md\n",
+    ]
     with open(install_txt, 'w') as f:
-        f.write("BioBeamer Launcher Installation\n")
-        f.write("===============================\n\n")
-        if platform == "win":
-            f.write("1. Run: setup.bat\n")
-            f.write("2. Start: start.bat\n\n")
-        else:
-            f.write("1. Run: ./setup.sh\n")
-            f.write("2. Start: ./start.sh\n\n")
-        f.write("For more details, see docs/ReadMe.md\n")
+        f.write("".join(lines))
     
     # Set executable permissions for Linux
     if platform == "linux":
@@ -126,6 +226,8 @@ def prepare_release(platform):
 
 
 if __name__ == "__main__":
-    prepare_release("win")
-    prepare_release("linux")
+    # Both archives are dominated by deflating the bundled uv binary, so build
+    # them in separate processes to use more than one core.
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        list(pool.map(prepare_release, ["win", "linux"]))
     print("Release packages created.")
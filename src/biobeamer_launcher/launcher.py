@@ -1,16 +1,27 @@
-import argparse
-import configparser
+import collections
+import functools
+import json
 import logging
 import os
 import platform
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
-import urllib.request
-import xml.etree.ElementTree as ET
 from typing import Optional
 
+# URL prefixes that fetch_xml_config downloads instead of reading from disk
+_URL_SCHEMES = ("http://", "https://", "ftp://")
+# Lines of git stderr kept for error messages (all lines are logged at debug level)
+_GIT_STDERR_TAIL_LINES = 50
+_LOG_FORMAT = "[%(asctime)s] %(levelname)s: %(message)s"
+# Project root is two levels above this file
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DEFAULT_CONFIG_PATH = os.path.join(_PROJECT_ROOT, "config", "launcher.ini")
+# launcher.ini path given with --config, set by load_config
+_config_path_override: Optional[str] = None
+
 
 def get_logger(
     name: str = "biobeamer_launcher",
@@ -20,43 +31,64 @@ def get_logger(
     logger = logging.getLogger(name)
     if not logger.handlers:
         logger.setLevel(level)
-        formatter = logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s")
         ch = logging.StreamHandler()
-        ch.setFormatter(formatter)
+        ch.setFormatter(logging.Formatter(_LOG_FORMAT))
         logger.addHandler(ch)
-        if log_dir:
-            os.makedirs(log_dir, exist_ok=True)
-            log_file = os.path.join(log_dir, f"{name}.log")
-            fh = logging.FileHandler(log_file)
-            fh.setFormatter(formatter)
-            logger.addHandler(fh)
+    if log_dir:
+        attach_file_handler(logger, log_dir)
     return logger
 
 
+def attach_file_handler(logger: logging.Logger, log_dir: str) -> None:
+    """Also log to <log_dir>/<logger name>.log, unless the logger already writes to that file."""
+    log_file = os.path.abspath(os.path.join(log_dir, f"{logger.name}.log"))
+    for handler in logger.handlers:
+        if (
+            isinstance(handler, logging.FileHandler)
+            and handler.baseFilename == log_file
+        ):
+            return
+    os.makedirs(log_dir, exist_ok=True)
+    fh = logging.FileHandler(log_file)
+    fh.setFormatter(logging.Formatter(_LOG_FORMAT))
+    logger.addHandler(fh)
+
+
 def get_xml_config_path() -> str:
     """Return the absolute path to the launcher.ini config file, allowing override by env or CLI."""
     # 1. Check CLI arg (set in main)
-    if hasattr(sys, "_launcher_config_override") and sys._launcher_config_override:
-        return sys._launcher_config_override
+    if _config_path_override:
+        return _config_path_override
     # 2. Check env var
     env_path = os.environ.get("BIOBEAMER_LAUNCHER_CONFIG")
     if env_path:
         return env_path
-    # 3. Default: look in <project-root>/config/launcher.ini, where project root is two levels above this file
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(project_root, "config", "launcher.ini")
+    # 3. Default: look in <project-root>/config/launcher.ini
+    return _DEFAULT_CONFIG_PATH
 
 
 def read_launcher_config(config_path: str, logger: logging.Logger) -> Optional[dict]:
     """Read the launcher.ini file and return config values as a dict, or None if not found."""
-    logger.debug(f"Attempting to read launcher config from: {config_path}")
-    config = configparser.ConfigParser()
-    if not os.path.exists(config_path):
-        logger.error(f"Config file not found: {config_path}")
+    logger.debug("Attempting to read launcher config from: %s", config_path)
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        logger.error("Config file not found: %s", config_path)
         return None
+    config_dict = dict(_parse_launcher_config(config_path, mtime_ns))
+    logger.info("Successfully read config file: %s", config_path)
+    logger.debug("Config values loaded: %r", config_dict)
+    return config_dict
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_launcher_config(config_path: str, mtime_ns: int) -> dict:
+    """Parse launcher.ini; cached per (path, mtime) so an unchanged file is parsed once."""
+    import configparser
+
+    config = configparser.ConfigParser()
     config.read(config_path)
-    logger.info(f"Successfully read config file: {config_path}")
-    config_dict = {
+    return {
         "biobeamer_repo_url": config.get("config", "biobeamer_repo_url", fallback=None),
         "xml_file_path": config.get("config", "xml_file_path", fallback=None),
         "host_name": config.get("config", "host_name", fallback=None),
@@ -66,40 +98,78 @@ def read_launcher_config(config_path: str, logger: logging.Logger) -> Optional[d
             "config", "sync_branches_to_remote", fallback=False
         ),
     }
-    logger.debug(f"Config values loaded: {config_dict}")
-    return config_dict
 
 
 def print_launcher_config(cfg: dict, logger: logging.Logger) -> None:
-    msg = (
+    logger.info(
         "BioBeamerLauncher configuration:\n"
-        f"  BioBeamer repo URL: {cfg['biobeamer_repo_url']}\n"
-        f"  Config file path: {cfg['xml_file_path']}\n"
-        f"  Host name: {cfg['host_name']}\n"
-        f"  Sync branches to remote: {cfg.get('sync_branches_to_remote', False)}"
+        "  BioBeamer repo URL: %s\n"
+        "  Config file path: %s\n"
+        "  Host name: %s\n"
+        "  Sync branches to remote: %s",
+        cfg["biobeamer_repo_url"],
+        cfg["xml_file_path"],
+        cfg["host_name"],
+        cfg.get("sync_branches_to_remote", False),
     )
-    logger.info(msg)
 
 
 def fetch_xml_config(xml_file_path: str, logger: logging.Logger) -> Optional[str]:
     """Fetch the XML config file from a local path or URL. Returns the local file path or None on failure. Caches remote XML in cache dir."""
+    import urllib.error
+    import urllib.request
+
     cache_dir = get_cache_dir()
-    os.makedirs(cache_dir, exist_ok=True)
     cache_xml_path = os.path.join(cache_dir, "BioBeamerConfig.xml")
-    if xml_file_path.startswith(("http://", "https://", "ftp://")):
+    if xml_file_path.startswith(_URL_SCHEMES):
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".xml") as tmp:
-                logger.info(f"Downloading XML config from {xml_file_path}...")
-                urllib.request.urlretrieve(xml_file_path, tmp.name)
-                logger.info(f"Downloaded XML config to {tmp.name}")
-                # Save a persistent copy in the cache
-                shutil.copy(tmp.name, cache_xml_path)
-                logger.info(f"Cached XML config at {cache_xml_path}")
+            logger.info("Downloading XML config from %s...", xml_file_path)
+            # Only a remote config is cached, so a local path never touches the cache dir
+            os.makedirs(cache_dir, exist_ok=True)
+            request = urllib.request.Request(xml_file_path)
+            meta_path = cache_xml_path + ".meta.json"
+            meta = read_cache_meta(meta_path, xml_file_path)
+            if meta and os.path.exists(cache_xml_path):
+                if meta.get("etag"):
+                    request.add_header("If-None-Match", meta["etag"])
+                if meta.get("last_modified"):
+                    request.add_header("If-Modified-Since", meta["last_modified"])
+            try:
+                response = urllib.request.urlopen(request, timeout=30)
+            except urllib.error.HTTPError as e:
+                if e.code != 304:
+                    raise
+                logger.info(
+                    "Remote XML config not modified, using cached copy: %s",
+                    cache_xml_path,
+                )
                 return cache_xml_path
+            # Download to a uniquely named file next to the cache file and rename
+            # it into place, so an interrupted download never replaces a good
+            # cached copy and concurrent launchers do not share a temp file.
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with response, os.fdopen(fd, "wb") as tmp:
+                    shutil.copyfileobj(response, tmp, length=1 << 20)
+                    headers = response.headers
+                os.replace(tmp_path, cache_xml_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            write_cache_meta(
+                meta_path,
+                {
+                    "url": xml_file_path,
+                    "etag": headers.get("ETag"),
+                    "last_modified": headers.get("Last-Modified"),
+                },
+            )
+            logger.info("Cached XML config at %s", cache_xml_path)
+            return cache_xml_path
         except Exception as e:
-            logger.warning(f"Failed to fetch remote XML: {e}. Trying cached copy...")
+            logger.warning("Failed to fetch remote XML: %s. Trying cached copy...", e)
             if os.path.exists(cache_xml_path):
-                logger.info(f"Using cached XML config: {cache_xml_path}")
+                logger.info("Using cached XML config: %s", cache_xml_path)
                 return cache_xml_path
             else:
                 logger.error("No cached XML config available.")
@@ -107,18 +177,42 @@ def fetch_xml_config(xml_file_path: str, logger: logging.Logger) -> Optional[str
     else:
         # Local file path
         if os.path.exists(xml_file_path):
-            logger.info(f"Using local XML config: {xml_file_path}")
+            logger.info("Using local XML config: %s", xml_file_path)
             return xml_file_path
         else:
-            logger.error(f"Local XML config not found: {xml_file_path}")
+            logger.error("Local XML config not found: %s", xml_file_path)
             return None
 
 
+def read_cache_meta(meta_path: str, url: str) -> Optional[dict]:
+    """Return the stored HTTP validators (ETag/Last-Modified) for url, or None if there are none."""
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get("url") != url:
+        return None
+    return meta
+
+
+def write_cache_meta(meta_path: str, meta: dict) -> None:
+    """Persist the HTTP validators of a cached download next to the cached file."""
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+
+
 def get_cache_dir() -> str:
     """Return a platform-independent cache directory for the config repo, honoring BIOBEAMER_LAUNCHER_CACHE_DIR env var if set."""
     env_cache_dir = os.environ.get("BIOBEAMER_LAUNCHER_CACHE_DIR")
     if env_cache_dir:
         return env_cache_dir
+    return _default_cache_dir()
+
+
+@functools.lru_cache(maxsize=None)
+def _default_cache_dir() -> str:
+    """Resolve the per-user cache directory once per process (the env override is checked by get_cache_dir)."""
     try:
         from platformdirs import user_cache_dir
 
@@ -140,30 +234,56 @@ def get_cache_dir() -> str:
 def parse_xml_and_select_host(
     xml_path: str, host_name: str, logger: logging.Logger
 ) -> Optional[dict]:
-    """Parse the XML config and return the host entry as a dict, or None if not found. Logs available host names if not found."""
+    """Stream the XML config and return the matching host entry as a dict, or None if not found. Direct children of the root take precedence over nested hosts. Logs available host names if not found."""
+    import lxml.etree as LET
+
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
         found_hosts = []
-        # Try direct children first
-        for host in root.findall("host"):
-            found_hosts.append(host.get("name"))
-            if host.get("name") == host_name:
-                logger.info(f"Found host entry: {host_name}")
-                return host.attrib
-        # Fallback: search at any depth
-        for host in root.findall(".//host"):
-            if host.get("name") not in found_hosts:
-                found_hosts.append(host.get("name"))
-            if host.get("name") == host_name:
-                logger.info(f"Found host entry (nested): {host_name}")
-                return host.attrib
+        seen = set()
+        nested_match = None
+        # iterparse visits <host> elements at any depth in a single pass. The
+        # attributes are complete at the start tag, so match there and stop
+        # without parsing the host's children; non-matches are freed at their end.
+        # The XML may come from a remote URL: never expand entities or fetch
+        # anything it references, whatever the installed lxml defaults are.
+        for event, host in LET.iterparse(
+            xml_path,
+            events=("start", "end"),
+            tag="host",
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=False,
+        ):
+            if event == "end":
+                host.clear(keep_tail=True)
+                # Drop the emptied earlier siblings too, so the tree under
+                # construction does not keep one node per skipped host.
+                while host.getprevious() is not None:
+                    del host.getparent()[0]
+                continue
+            name = host.get("name")
+            if name == host_name:
+                parent = host.getparent()
+                if parent is not None and parent.getparent() is None:
+                    logger.info("Found host entry: %s", host_name)
+                    return dict(host.attrib)
+                # A nested match only wins if no direct child matches
+                if nested_match is None:
+                    nested_match = dict(host.attrib)
+            if name not in seen:
+                seen.add(name)
+                found_hosts.append(name)
+        if nested_match is not None:
+            logger.info("Found host entry (nested): %s", host_name)
+            return nested_match
         logger.error(
-            f"Host '{host_name}' not found in XML config. Available hosts: {found_hosts}"
+            "Host '%s' not found in XML config. Available hosts: %s",
+            host_name,
+            found_hosts,
         )
         return None
     except Exception as e:
-        logger.error(f"Error parsing XML: {e}")
+        logger.error("Error parsing XML: %s", e)
         return None
 
 
@@ -173,12 +293,32 @@ def extract_biobeamer_version(
     """Extract the BioBeamer version from the host entry, if present."""
     version = host_entry.get("version")
     if version:
-        logger.info(f"Extracted BioBeamer version: {version}")
+        logger.info("Extracted BioBeamer version: %s", version)
     else:
         logger.error("No BioBeamer version found in host entry.")
     return version
 
 
+def run_git(
+    args: list,
+    repo_path: Optional[str] = None,
+    logger: Optional[logging.Logger] = None,
+) -> subprocess.CompletedProcess:
+    """Run git (inside repo_path if given), discarding stdout. stderr is logged at debug level as it arrives; only its last lines are kept."""
+    cmd = ["git"] + (["-C", repo_path] if repo_path else []) + list(args)
+    stderr_tail = collections.deque(maxlen=_GIT_STDERR_TAIL_LINES)
+    # The launcher runs unattended: fail instead of waiting for credentials
+    env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+    with subprocess.Popen(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=env
+    ) as proc:
+        for line in proc.stderr:
+            stderr_tail.append(line)
+            if logger:
+                logger.debug("git: %s", line.rstrip())
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, "".join(stderr_tail))
+
+
 def fetch_or_update_biobeamer_repo(
     repo_url: str,
     version: str,
@@ -192,46 +332,124 @@ def fetch_or_update_biobeamer_repo(
         return None
     repo_path = os.path.join(cache_dir, "BioBeamer")
     if not os.path.exists(repo_path):
-        logger.info(f"Cloning BioBeamer repo from {repo_url} to {repo_path}...")
-        result = subprocess.run(
-            ["git", "clone", repo_url, repo_path], capture_output=True
+        logger.info("Cloning BioBeamer repo from %s to %s...", repo_url, repo_path)
+        # Only the requested tag/branch is needed, so start with a shallow clone
+        result = run_git(
+            [
+                "clone",
+                "--quiet",
+                "--depth",
+                "1",
+                "--branch",
+                version,
+                repo_url,
+                repo_path,
+            ],
+            logger=logger,
         )
-        if result.returncode != 0:
-            logger.error(
-                f"Failed to clone BioBeamer repo: {result.stderr.decode().strip()}"
+        if result.returncode == 0:
+            # A --branch clone only tracks that one ref; restore the usual
+            # refspec so other branches can be checked out after a fetch.
+            result = run_git(
+                [
+                    "config",
+                    "remote.origin.fetch",
+                    "+refs/heads/*:refs/remotes/origin/*",
+                ],
+                repo_path,
+                logger=logger,
             )
+            if result.returncode != 0:
+                logger.error(
+                    "Failed to configure cloned BioBeamer repo: %s",
+                    result.stderr.strip(),
+                )
+                # Do not leave a single-branch clone for the next run to update
+                shutil.rmtree(repo_path, ignore_errors=True)
+                return None
+            # --branch already checked out the requested version at the
+            # remote tip, so there is nothing left to check out or reset.
+            logger.info("Cloned BioBeamer version %s", version)
+            return repo_path
+        # e.g. version is a commit SHA, which --branch cannot resolve
+        logger.info(
+            "Shallow clone of %s failed (%s), falling back to a full clone...",
+            version,
+            result.stderr.strip(),
+        )
+        shutil.rmtree(repo_path, ignore_errors=True)
+        # A plain (not blob-filtered) clone, so checking out older commits
+        # later works from the cached repo without network access.
+        result = run_git(["clone", "--quiet", repo_url, repo_path], logger=logger)
+        if result.returncode != 0:
+            logger.error("Failed to clone BioBeamer repo: %s", result.stderr.strip())
             return None
+    elif is_version_checked_out(repo_path, version):
+        # Tags and commit hashes do not move, so there is nothing to fetch or check out
+        logger.info(
+            "BioBeamer repo at %s is already at version %s, skipping update.",
+            repo_path,
+            version,
+        )
+        return repo_path
     else:
-        logger.info(f"Updating existing BioBeamer repo at {repo_path}...")
-        result = subprocess.run(
-            ["git", "-C", repo_path, "fetch", "--all"], capture_output=True
+        logger.info("Updating existing BioBeamer repo at %s...", repo_path)
+        # Fetch just the requested ref, trying it as a tag first and then as a branch
+        result = run_git(
+            [
+                "fetch",
+                "--quiet",
+                "--depth",
+                "1",
+                "origin",
+                f"+refs/tags/{version}:refs/tags/{version}",
+            ],
+            repo_path,
+            logger=logger,
         )
         if result.returncode != 0:
-            logger.error(f"Failed to fetch updates: {result.stderr.decode().strip()}")
+            result = run_git(
+                [
+                    "fetch",
+                    "--quiet",
+                    "--depth",
+                    "1",
+                    "origin",
+                    f"+refs/heads/{version}:refs/remotes/origin/{version}",
+                ],
+                repo_path,
+                logger=logger,
+            )
+        if result.returncode != 0:
+            # Not a tag or branch name: fetch everything, including full history
+            fetch_args = ["fetch", "--quiet", "--tags", "origin"]
+            if os.path.exists(os.path.join(repo_path, ".git", "shallow")):
+                fetch_args.append("--unshallow")
+            result = run_git(fetch_args, repo_path, logger=logger)
+        if result.returncode != 0:
+            logger.error("Failed to fetch updates: %s", result.stderr.strip())
             return None
     # Try to checkout the version as a tag or branch
-    logger.info(f"Checking out BioBeamer version: {version}")
-    result = subprocess.run(
-        ["git", "-C", repo_path, "checkout", version], capture_output=True
-    )
+    logger.info("Checking out BioBeamer version: %s", version)
+    result = run_git(["checkout", version], repo_path, logger=logger)
     if result.returncode != 0:
         logger.error(
-            f"Failed to checkout version {version}: {result.stderr.decode().strip()}"
+            "Failed to checkout version %s: %s", version, result.stderr.strip()
         )
         return None
 
     # Optionally reset to ensure we have the latest remote version (important for branches)
     if sync_branches_to_remote:
         logger.info(
-            f"Resetting to origin/{version} to ensure latest remote version (sync_branches_to_remote=True)"
+            "Resetting to origin/%s to ensure latest remote version (sync_branches_to_remote=True)",
+            version,
         )
-        result = subprocess.run(
-            ["git", "-C", repo_path, "reset", "--hard", f"origin/{version}"],
-            capture_output=True,
+        result = run_git(
+            ["reset", "--hard", f"origin/{version}"], repo_path, logger=logger
         )
         if result.returncode != 0:
             logger.warning(
-                f"Failed to reset to origin/{version}: {result.stderr.decode().strip()}"
+                "Failed to reset to origin/%s: %s", version, result.stderr.strip()
             )
             # Don't return None here - checkout succeeded, reset is just optimization
     else:
@@ -242,6 +460,8 @@ def fetch_or_update_biobeamer_repo(
 
 def parse_args():
     """Parse command-line arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", help="Path to launcher.ini config file")
     parser.add_argument(
@@ -253,15 +473,11 @@ def parse_args():
     return args
 
 
-def setup_logger(log_dir: str) -> logging.Logger:
-    """Set up and return a logger."""
-    return get_logger("biobeamer_launcher", logging.INFO, log_dir=log_dir)
-
-
 def load_config(args, logger: logging.Logger) -> Optional[dict]:
     """Load the launcher config, possibly using CLI override."""
+    global _config_path_override
     if args.config:
-        sys._launcher_config_override = args.config
+        _config_path_override = args.config
     xml_config_path = get_xml_config_path()
     cfg = read_launcher_config(xml_config_path, logger=logger)
     return cfg
@@ -272,7 +488,7 @@ def fetch_and_log_xml_config(cfg, logger):
     if not xml_path:
         logger.error("Could not fetch XML config file.")
         return None
-    logger.info(f"XML config file path: {xml_path}")
+    logger.info("XML config file path: %s", xml_path)
     return xml_path
 
 
@@ -281,14 +497,14 @@ def select_host_entry(xml_path, cfg, logger):
     if not host_entry:
         logger.error("Could not find host entry in XML.")
         return None
-    logger.info(f"Selected host entry: {host_entry}")
+    logger.info("Selected host entry: %s", host_entry)
     return host_entry
 
 
 def extract_and_log_version(host_entry, logger):
     version = extract_biobeamer_version(host_entry, logger=logger)
     if version:
-        logger.info(f"BioBeamer version specified in host entry: {version}")
+        logger.info("BioBeamer version specified in host entry: %s", version)
     else:
         logger.error("No BioBeamer version specified in host entry.")
     return version
@@ -309,6 +525,7 @@ def prepare_biobeamer_repo(cfg, version, logger):
     return repo_path
 
 
+@functools.lru_cache(maxsize=None)
 def find_uv_executable():
     """
     Find the uv executable to use for venv and pip commands.
@@ -317,32 +534,97 @@ def find_uv_executable():
     2. uv in PATH
     3. scripts/uv relative to project root
     4. scripts/uv.exe (for Windows)
+    The result is cached for the lifetime of the process.
     """
-    import shutil
-
     uv_env = os.environ.get("UV_PATH")
-    if uv_env and os.path.isfile(uv_env) and os.access(uv_env, os.X_OK):
+    if uv_env and is_executable_file(uv_env):
         return uv_env
     uv_in_path = shutil.which("uv")
     if uv_in_path:
         return uv_in_path
     # Try bundled scripts/uv
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    uv_script = os.path.join(project_root, "scripts", "uv")
-    if os.path.isfile(uv_script) and os.access(uv_script, os.X_OK):
+    uv_script = os.path.join(_PROJECT_ROOT, "scripts", "uv")
+    if is_executable_file(uv_script):
         return uv_script
-    uv_script_win = os.path.join(project_root, "scripts", "uv.exe")
-    if os.path.isfile(uv_script_win) and os.access(uv_script_win, os.X_OK):
+    uv_script_win = os.path.join(_PROJECT_ROOT, "scripts", "uv.exe")
+    if is_executable_file(uv_script_win):
         return uv_script_win
     raise FileNotFoundError(
         "Could not find 'uv' executable. Please ensure it is installed and available in your PATH, or set UV_PATH."
     )
 
 
+def is_executable_file(path: str) -> bool:
+    """Return True if path is a regular file with an execute bit set, using a single stat call."""
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
+    return stat.S_ISREG(mode) and bool(
+        mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    )
+
+
+def get_repo_head_sha(repo_path: str) -> Optional[str]:
+    """Return the commit hash checked out in repo_path, or None if it cannot be determined."""
+    return resolve_commit(repo_path, "HEAD")
+
+
+def resolve_commit(repo_path: str, rev: str) -> Optional[str]:
+    """Return the commit hash rev resolves to in repo_path (local refs only), or None."""
+    result = subprocess.run(
+        [
+            "git",
+            "-C",
+            repo_path,
+            "rev-parse",
+            "--verify",
+            "--quiet",
+            f"{rev}^{{commit}}",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def is_version_checked_out(repo_path: str, version: str) -> bool:
+    """Return True if HEAD is already at version and version is a tag or full commit hash (refs that do not move)."""
+    head = get_repo_head_sha(repo_path)
+    if head is None:
+        return False
+    if resolve_commit(repo_path, f"refs/tags/{version}") == head:
+        return True
+    # Only a full commit hash is unambiguous: an abbreviated one may also be a
+    # (hex-looking) branch name, which can move.
+    return version.lower() == head
+
+
+def read_installed_sha(installed_sha_file: str) -> Optional[str]:
+    """Return the repo commit hash recorded at the last successful install, if any."""
+    try:
+        with open(installed_sha_file) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def get_venv_env(venv_dir: str, venv_bin_dir: str) -> dict:
+    """Return a copy of the environment with the given venv activated."""
+    env = os.environ.copy()
+    env["VIRTUAL_ENV"] = venv_dir
+    env["PATH"] = venv_bin_dir + os.pathsep + env.get("PATH", "")
+    return env
+
+
 def setup_biobeamer_venv(repo_path, version, logger):
     """
     Set up a virtual environment for the given BioBeamer version and install BioBeamer into it.
     Creates the venv if it doesn't exist, installs BioBeamer from the repo path.
+    The install is skipped when the venv already has BioBeamer installed from the
+    repo's current HEAD commit (recorded in <venv>/.installed_sha).
     Returns the path to the venv's bin/Scripts directory.
     """
     cache_dir = get_cache_dir()
@@ -350,45 +632,55 @@ def setup_biobeamer_venv(repo_path, version, logger):
     venv_bin = os.path.join(venv_dir, "bin")
     venv_scripts = os.path.join(venv_dir, "Scripts")
     if platform.system() == "Windows":
+        venv_bin_dir = venv_scripts
         venv_python = os.path.join(venv_scripts, "python.exe")
         venv_biobeamer = os.path.join(venv_scripts, "biobeamer.exe")
     else:
+        venv_bin_dir = venv_bin
         venv_python = os.path.join(venv_bin, "python")
         venv_biobeamer = os.path.join(venv_bin, "biobeamer")
+    installed_sha_file = os.path.join(venv_dir, ".installed_sha")
+    repo_sha = get_repo_head_sha(repo_path)
+    if os.path.exists(venv_biobeamer) and (
+        repo_sha is None or read_installed_sha(installed_sha_file) == repo_sha
+    ):
+        logger.info(
+            "BioBeamer venv for version %s already exists at %s.", version, venv_dir
+        )
+        return venv_bin_dir
     uv_exe = find_uv_executable()
-    if not os.path.exists(venv_biobeamer):
+    if not os.path.exists(venv_python):
         logger.info(
-            f"Creating venv for BioBeamer version {version} at {venv_dir} using uv..."
+            "Creating venv for BioBeamer version %s at %s using uv...",
+            version,
+            venv_dir,
         )
         # Create venv
         result = subprocess.run(
             [uv_exe, "venv", venv_dir],
-            capture_output=True,
-        )
-        if result.returncode != 0:
-            logger.error(f"Failed to create venv: {result.stderr.decode().strip()}")
-            return None
-        # Install BioBeamer from repo_path
-        logger.info(f"Installing BioBeamer into venv from {repo_path}...")
-        result = subprocess.run(
-            [uv_exe, "pip", "install", "-e", repo_path],
-            env={
-                **os.environ,
-                "VIRTUAL_ENV": venv_dir,
-                "PATH": f"{venv_bin if platform.system() != 'Windows' else venv_scripts}:{os.environ.get('PATH','')}",
-            },
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
         )
         if result.returncode != 0:
-            logger.error(
-                f"Failed to install BioBeamer: {result.stderr.decode().strip()}"
-            )
+            logger.error("Failed to create venv: %s", result.stderr.strip())
             return None
-    else:
-        logger.info(
-            f"BioBeamer venv for version {version} already exists at {venv_dir}."
-        )
-    return venv_bin if platform.system() != "Windows" else venv_scripts
+    # Install BioBeamer from repo_path (again, if the checked-out commit changed)
+    logger.info("Installing BioBeamer into venv from %s...", repo_path)
+    result = subprocess.run(
+        [uv_exe, "pip", "install", "-e", repo_path],
+        env=get_venv_env(venv_dir, venv_bin_dir),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        logger.error("Failed to install BioBeamer: %s", result.stderr.strip())
+        return None
+    if repo_sha:
+        with open(installed_sha_file, "w") as f:
+            f.write(repo_sha)
+    return venv_bin_dir
 
 
 def run_biobeamer_process(repo_path, xml_path, cfg, log_dir, logger, version=None):
@@ -404,7 +696,7 @@ def run_biobeamer_process(repo_path, xml_path, cfg, log_dir, logger, version=Non
     else:
         biobeamer_exe = os.path.join(venv_bin, "biobeamer")
     if not os.path.exists(biobeamer_exe):
-        logger.error(f"BioBeamer entry point not found: {biobeamer_exe}")
+        logger.error("BioBeamer entry point not found: %s", biobeamer_exe)
         return 14
     biobeamer_log_file = os.path.join(
         log_dir, f"biobeamer_subprocess_{cfg['host_name']}.log"
@@ -421,23 +713,24 @@ def run_biobeamer_process(repo_path, xml_path, cfg, log_dir, logger, version=Non
     # Only add password if it's not empty
     if cfg["password"]:
         cmd.extend(["--password", cfg["password"]])
-    logger.info(f"Running BioBeamer: {' '.join(cmd)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Running BioBeamer: %s", " ".join(cmd))
     try:
-        with open(biobeamer_log_file, "w") as logf:
-            result = subprocess.run(
-                cmd, stdout=logf, stderr=subprocess.STDOUT, text=True
-            )
-        logger.info(f"BioBeamer subprocess log written to: {biobeamer_log_file}")
+        # The child writes straight to the log file descriptor; nothing is decoded here
+        with open(biobeamer_log_file, "wb") as logf:
+            result = subprocess.run(cmd, stdout=logf, stderr=subprocess.STDOUT)
+        logger.info("BioBeamer subprocess log written to: %s", biobeamer_log_file)
         if result.returncode != 0:
-            logger.error(f"BioBeamer exited with code {result.returncode}")
+            logger.error("BioBeamer exited with code %s", result.returncode)
             return result.returncode
         else:
             logger.info(
-                f"BioBeamer subprocess finished; see subprocess log for output: {biobeamer_log_file}"
+                "BioBeamer subprocess finished; see subprocess log for output: %s",
+                biobeamer_log_file,
             )
             return 0
     except Exception as e:
-        logger.exception(f"Failed to run BioBeamer: {e}")
+        logger.exception("Failed to run BioBeamer: %s", e)
         return 11  # nonzero error code
 
 
@@ -551,15 +844,15 @@ def print_debug_info(cfg, logger):
 def main() -> None:
     """Main entry point for BioBeamerLauncher."""
     args = parse_args()
-    # Load config first, using a temporary logger (stderr only)
-    temp_logger = get_logger("biobeamer_launcher_temp", logging.INFO, log_dir=None)
-    cfg = load_config(args, temp_logger)
+    # Load config first, logging to stderr only until the log_dir is known
+    logger = get_logger("biobeamer_launcher", logging.INFO)
+    cfg = load_config(args, logger)
     if not cfg:
-        temp_logger.error("Could not read launcher config.")
+        logger.error("Could not read launcher config.")
         sys.exit(30)
     log_dir = cfg["log_dir"] if cfg and cfg.get("log_dir") else get_cache_dir()
-    # Now set up the real logger in the correct log_dir
-    logger = setup_logger(log_dir)
+    # Now also log to a file in the correct log_dir
+    attach_file_handler(logger, log_dir)
     if getattr(args, "debug", False):
         exit_code = print_debug_info(cfg, logger)
         sys.exit(exit_code)
@@ -1,5 +1,10 @@
+import os
+import shutil
+import subprocess
 import textwrap
 
+_GIT_IDENTITY = ["-c", "user.email=test@example.com", "-c", "user.name=Test User"]
+
 
 def make_dummy_biobeamer2_py(path, variant="log_files"):
     """
@@ -95,3 +100,27 @@ biobeamer = "biobeamer.cli:main"
 """
     with open(path, "w") as f:
         f.write(toml)
+
+
+def link_or_copy(src, dst):
+    """Hardlink `src` to `dst`, falling back to a plain copy if linking fails."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+
+def git(*args, cwd):
+    """Run a git command in `cwd` with a fixed test identity instead of repo config."""
+    return subprocess.run(["git", *_GIT_IDENTITY, *args], cwd=cwd, check=True)
+
+
+def make_tagged_repo(path, tag="v1"):
+    """Create a git repo at `path` with one commit tagged `tag`, and return the path."""
+    path.mkdir(parents=True, exist_ok=True)
+    git("init", "-q", cwd=path)
+    (path / "README").write_text(tag)
+    git("add", "README", cwd=path)
+    git("commit", "-q", "-m", tag, cwd=path)
+    git("tag", tag, cwd=path)
+    return path
@@ -14,83 +14,78 @@ LAUNCHER_EXE = os.path.join(VENV_BIN, "biobeamer-launcher")
 LAUNCHER_EXE_WIN = os.path.join(VENV_SCRIPTS, "biobeamer-launcher.exe")
 SETUP_SCRIPT = os.path.join(SCRIPTS_DIR, "setup.sh")
 SETUP_BAT = os.path.join(SCRIPTS_DIR, "setup.bat")
+IS_WINDOWS = platform.system() == "Windows"
+# Upper bounds so a hung download or script fails the test instead of the whole run
+SETUP_TIMEOUT = 600
+COMMAND_TIMEOUT = 60
+
+
+LINUX_ONLY = pytest.mark.skipif(IS_WINDOWS, reason="Linux-only variant")
+WINDOWS_ONLY = pytest.mark.skipif(not IS_WINDOWS, reason="Windows-only variant")
 
 
 @pytest.mark.order(1)
-def test_setup_script_runs():
-    if platform.system() == "Windows":
-        pytest.skip("Skipping setup.sh test on Windows")
+@pytest.mark.parametrize(
+    "setup_cmd,cwd",
+    [
+        # Run setup.sh from the project root so venv is created in the right place
+        pytest.param(["bash", SETUP_SCRIPT], PROJECT_ROOT, marks=LINUX_ONLY, id="setup.sh"),
+        pytest.param(["cmd.exe", "/c", SETUP_BAT], None, marks=WINDOWS_ONLY, id="setup.bat"),
+    ],
+)
+def test_setup_script_runs(setup_cmd, cwd):
+    script = setup_cmd[-1]
+    script_name = os.path.basename(script)
     # Remove venv if it exists
     if os.path.exists(VENV_DIR):
         shutil.rmtree(VENV_DIR)
-    assert os.path.exists(SETUP_SCRIPT), f"Setup script not found: {SETUP_SCRIPT}"
-    # Run the setup script from the project root so venv is created in the right place
+    assert os.path.exists(script), f"{script_name} not found: {script}"
     result = subprocess.run(
-        ["bash", SETUP_SCRIPT], capture_output=True, text=True, cwd=PROJECT_ROOT
+        setup_cmd,
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        timeout=SETUP_TIMEOUT,
     )
     print(result.stdout)
     print(result.stderr)
-    assert result.returncode == 0, f"setup.sh failed: {result.stderr}"
-    assert os.path.isdir(VENV_DIR), "Virtual environment was not created."
+    assert result.returncode == 0, f"{script_name} failed: {result.stderr}"
+    assert os.path.isdir(
+        VENV_DIR
+    ), f"Virtual environment was not created by {script_name}."
 
 
 @pytest.mark.order(2)
-def test_biobeamer_launcher_installed():
-    if platform.system() == "Windows":
-        pytest.skip("Skipping Linux launcher test on Windows")
-    assert os.path.isdir(VENV_BIN), f"Venv bin dir not found: {VENV_BIN}"
-    launcher_path = LAUNCHER_EXE
+@pytest.mark.parametrize(
+    "bin_dir,launcher_path",
+    [
+        pytest.param(VENV_BIN, LAUNCHER_EXE, marks=LINUX_ONLY, id="linux"),
+        pytest.param(VENV_SCRIPTS, LAUNCHER_EXE_WIN, marks=WINDOWS_ONLY, id="windows"),
+    ],
+)
+def test_biobeamer_launcher_installed(bin_dir, launcher_path):
+    launcher_name = os.path.basename(launcher_path)
+    assert os.path.isdir(bin_dir), f"Venv bin dir not found: {bin_dir}"
     assert os.path.isfile(
         launcher_path
-    ), f"biobeamer-launcher not found in venv: {launcher_path}"
-    result = subprocess.run([launcher_path, "--help"], capture_output=True, text=True)
-    print(result.stdout)
-    print(result.stderr)
-    assert result.returncode == 0, "biobeamer-launcher --help failed"
-    assert (
-        "usage" in result.stdout.lower() or "usage" in result.stderr.lower()
-    ), "Help output not found"
-
-
-@pytest.mark.order(3)
-def test_setup_bat_runs():
-    if platform.system() != "Windows":
-        pytest.skip("setup.bat test only runs on Windows")
-    # Remove venv if it exists
-    if os.path.exists(VENV_DIR):
-        shutil.rmtree(VENV_DIR)
-    assert os.path.exists(SETUP_BAT), f"Setup.bat not found: {SETUP_BAT}"
+    ), f"{launcher_name} not found in venv: {launcher_path}"
     result = subprocess.run(
-        ["cmd.exe", "/c", SETUP_BAT], capture_output=True, text=True
+        [launcher_path, "--help"],
+        capture_output=True,
+        text=True,
+        timeout=COMMAND_TIMEOUT,
     )
     print(result.stdout)
     print(result.stderr)
-    assert result.returncode == 0, f"setup.bat failed: {result.stderr}"
-    assert os.path.isdir(VENV_DIR), "Virtual environment was not created by setup.bat."
-
-
-@pytest.mark.order(4)
-def test_biobeamer_launcher_installed_win():
-    if platform.system() != "Windows":
-        pytest.skip("Windows launcher test only runs on Windows")
-    assert os.path.isdir(VENV_SCRIPTS), f"Venv Scripts dir not found: {VENV_SCRIPTS}"
-    launcher_path = LAUNCHER_EXE_WIN
-    assert os.path.isfile(
-        launcher_path
-    ), f"biobeamer-launcher.exe not found in venv: {launcher_path}"
-    result = subprocess.run([launcher_path, "--help"], capture_output=True, text=True)
-    print(result.stdout)
-    print(result.stderr)
-    assert result.returncode == 0, "biobeamer-launcher.exe --help failed"
+    assert result.returncode == 0, f"{launcher_name} --help failed"
     assert (
         "usage" in result.stdout.lower() or "usage" in result.stderr.lower()
     ), "Help output not found"
 
 
 @pytest.mark.order(5)
+@pytest.mark.skipif(IS_WINDOWS, reason="Skipping start.sh test on Windows")
 def test_start_script_runs():
-    if platform.system() == "Windows":
-        pytest.skip("Skipping start.sh test on Windows")
     assert os.path.isdir(VENV_BIN), "Venv bin dir not found for start.sh test"
     
     # Test the actual release package, not the development script
@@ -105,7 +100,7 @@ def test_start_script_runs():
         make_release_script = os.path.join(PROJECT_ROOT, "make_release.py")
         result = subprocess.run(
             [sys.executable, make_release_script], 
-            capture_output=True, text=True, cwd=PROJECT_ROOT
+            capture_output=True, text=True, cwd=PROJECT_ROOT, timeout=SETUP_TIMEOUT
         )
         assert result.returncode == 0, f"Failed to create release package: {result.stderr}"
     
@@ -118,7 +113,11 @@ def test_start_script_runs():
         shutil.rmtree(release_venv)
     
     setup_result = subprocess.run(
-        ["bash", setup_script], capture_output=True, text=True, cwd=release_dir
+        ["bash", setup_script],
+        capture_output=True,
+        text=True,
+        cwd=release_dir,
+        timeout=SETUP_TIMEOUT,
     )
     print("Setup output:", setup_result.stdout)
     print("Setup errors:", setup_result.stderr)
@@ -141,9 +140,8 @@ def test_start_script_runs():
 
 
 @pytest.mark.order(6)
+@pytest.mark.skipif(not IS_WINDOWS, reason="start.bat test only runs on Windows")
 def test_start_bat_runs():
-    if platform.system() != "Windows":
-        pytest.skip("start.bat test only runs on Windows")
     assert os.path.isdir(VENV_SCRIPTS), "Venv Scripts dir not found for start.bat test"
     
     # Test the actual release package, not the development script
@@ -158,7 +156,7 @@ def test_start_bat_runs():
         make_release_script = os.path.join(PROJECT_ROOT, "make_release.py")
         result = subprocess.run(
             [sys.executable, make_release_script], 
-            capture_output=True, text=True, cwd=PROJECT_ROOT
+            capture_output=True, text=True, cwd=PROJECT_ROOT, timeout=SETUP_TIMEOUT
         )
         assert result.returncode == 0, f"Failed to create release package: {result.stderr}"
     
@@ -171,7 +169,11 @@ def test_start_bat_runs():
         shutil.rmtree(release_venv)
     
     setup_result = subprocess.run(
-        ["cmd.exe", "/c", setup_bat], capture_output=True, text=True, cwd=release_dir
+        ["cmd.exe", "/c", setup_bat],
+        capture_output=True,
+        text=True,
+        cwd=release_dir,
+        timeout=SETUP_TIMEOUT,
     )
     print("Setup output:", setup_result.stdout)
     print("Setup errors:", setup_result.stderr)
@@ -1,9 +1,17 @@
+import functools
 import importlib.util
+import io
+import logging
 import os
+import subprocess
 from pathlib import Path
 
+from conftest import git, make_tagged_repo
 
+
+@functools.lru_cache(maxsize=None)
 def import_launcher():
+    """Load launcher.py from the source tree once and share it across tests."""
     launcher_path = os.path.abspath(
         os.path.join(
             os.path.dirname(__file__), "..", "src", "biobeamer_launcher", "launcher.py"
@@ -27,6 +35,24 @@ def test_read_launcher_config(tmp_path):
     assert cfg["host_name"] == "testhost"
 
 
+def test_read_launcher_config_rereads_changed_file(tmp_path):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    ini_path = tmp_path / "launcher.ini"
+    ini_path.write_text("[config]\nhost_name = first\n")
+    assert (
+        launcher.read_launcher_config(str(ini_path), logger=logger)["host_name"]
+        == "first"
+    )
+    ini_path.write_text("[config]\nhost_name = second\n")
+    st = os.stat(ini_path)
+    os.utime(ini_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert (
+        launcher.read_launcher_config(str(ini_path), logger=logger)["host_name"]
+        == "second"
+    )
+
+
 def test_print_launcher_config(caplog):
     launcher = import_launcher()
     logger = launcher.get_logger("test_logger")
@@ -55,16 +81,24 @@ def test_fetch_xml_config_local(tmp_path, caplog):
     assert "Using local XML config" in caplog.text
 
 
+class FakeResponse(io.BytesIO):
+    def __init__(self, data, headers=None):
+        super().__init__(data)
+        self.headers = headers or {}
+
+
 def test_fetch_xml_config_remote(monkeypatch, tmp_path, caplog):
+    import urllib.request
+
     launcher = import_launcher()
     logger = launcher.get_logger("test_logger")
+    monkeypatch.setenv("BIOBEAMER_LAUNCHER_CACHE_DIR", str(tmp_path / "cache"))
 
-    # Patch urllib.request.urlretrieve to simulate download
-    def fake_urlretrieve(url, filename):
-        Path(filename).write_text("<root/>")
-        return (filename, None)
+    # Patch urllib.request.urlopen to simulate download
+    def fake_urlopen(request, timeout=None):
+        return FakeResponse(b"<root/>")
 
-    monkeypatch.setattr(launcher.urllib.request, "urlretrieve", fake_urlretrieve)
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
     url = "http://example.com/test.xml"
     with caplog.at_level("INFO", logger="test_logger"):
         result = launcher.fetch_xml_config(url, logger=logger)
@@ -74,6 +108,54 @@ def test_fetch_xml_config_remote(monkeypatch, tmp_path, caplog):
     os.remove(result)
 
 
+def test_fetch_xml_config_remote_failed_download_leaves_no_temp_file(
+    monkeypatch, tmp_path
+):
+    import urllib.request
+
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("BIOBEAMER_LAUNCHER_CACHE_DIR", str(cache_dir))
+
+    class BrokenResponse(FakeResponse):
+        def read(self, *args):
+            raise OSError("connection reset")
+
+    monkeypatch.setattr(
+        urllib.request, "urlopen", lambda request, timeout=None: BrokenResponse(b"")
+    )
+    assert launcher.fetch_xml_config("http://example.com/test.xml", logger) is None
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_fetch_xml_config_remote_not_modified(monkeypatch, tmp_path, caplog):
+    import urllib.error
+    import urllib.request
+
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    monkeypatch.setenv("BIOBEAMER_LAUNCHER_CACHE_DIR", str(tmp_path / "cache"))
+    url = "http://example.com/test.xml"
+    sent_headers = []
+
+    def fake_urlopen(request, timeout=None):
+        sent_headers.append(dict(request.header_items()))
+        if request.get_header("If-none-match") == '"v1"':
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+        return FakeResponse(b"<root/>", {"ETag": '"v1"'})
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    first = launcher.fetch_xml_config(url, logger=logger)
+    with caplog.at_level("INFO", logger="test_logger"):
+        second = launcher.fetch_xml_config(url, logger=logger)
+    assert first == second
+    assert Path(second).read_text() == "<root/>"
+    assert "If-none-match" not in sent_headers[0]
+    assert sent_headers[1]["If-none-match"] == '"v1"'
+    assert "not modified" in caplog.text
+
+
 def test_get_cache_dir_env(monkeypatch, tmp_path):
     launcher = import_launcher()
     monkeypatch.setenv("BIOBEAMER_LAUNCHER_CACHE_DIR", str(tmp_path / "cache"))
@@ -100,8 +182,223 @@ def test_parse_xml_and_select_host(tmp_path, caplog):
         assert "Host 'bar' not found in XML config." in caplog.text
 
 
+def test_parse_xml_and_select_host_nested(tmp_path):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    xml_path = tmp_path / "test.xml"
+    xml_path.write_text(
+        '<BioBeamerHosts><group><host name="foo" version="1"/>'
+        '<host name="bar" version="2"/></group></BioBeamerHosts>'
+    )
+    result = launcher.parse_xml_and_select_host(str(xml_path), "bar", logger=logger)
+    assert result == {"name": "bar", "version": "2"}
+
+
+def test_parse_xml_and_select_host_prefers_direct_child(tmp_path):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    xml_path = tmp_path / "test.xml"
+    xml_path.write_text(
+        '<BioBeamerHosts><group><host name="foo" version="nested"/></group>'
+        '<host name="foo" version="direct"/></BioBeamerHosts>'
+    )
+    result = launcher.parse_xml_and_select_host(str(xml_path), "foo", logger=logger)
+    assert result == {"name": "foo", "version": "direct"}
+
+
 def test_extract_biobeamer_version():
     launcher = import_launcher()
     logger = launcher.get_logger("test_logger")
     host_entry = {"name": "foo", "version": "1.2.3"}
     assert launcher.extract_biobeamer_version(host_entry, logger=logger) == "1.2.3"
+
+
+def test_get_venv_env(monkeypatch, tmp_path):
+    launcher = import_launcher()
+    monkeypatch.setenv("PATH", "original")
+    venv_bin_dir = str(tmp_path / "bin")
+    env = launcher.get_venv_env(str(tmp_path), venv_bin_dir)
+    assert env["VIRTUAL_ENV"] == str(tmp_path)
+    assert env["PATH"] == venv_bin_dir + os.pathsep + "original"
+    assert os.environ["PATH"] == "original"
+
+
+def test_fetch_or_update_biobeamer_repo_skips_fetch_at_tag(monkeypatch, tmp_path):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    upstream = make_tagged_repo(tmp_path / "upstream")
+    cache_dir = str(tmp_path / "cache")
+    repo_url = upstream.as_uri()
+    repo_path = launcher.fetch_or_update_biobeamer_repo(
+        repo_url, "v1", cache_dir, logger=logger
+    )
+    assert repo_path
+
+    def fail_run_git(args, repo_path=None, logger=None):
+        raise AssertionError(f"unexpected git call: {args}")
+
+    monkeypatch.setattr(launcher, "run_git", fail_run_git)
+    assert (
+        launcher.fetch_or_update_biobeamer_repo(
+            repo_url, "v1", cache_dir, logger=logger
+        )
+        == repo_path
+    )
+
+
+def test_is_version_checked_out_ignores_hex_branch_names(tmp_path):
+    launcher = import_launcher()
+    repo = make_tagged_repo(tmp_path / "repo")
+    head = launcher.get_repo_head_sha(str(repo))
+    # A branch whose name is also a prefix of HEAD can move, so never skip on it
+    git("branch", head[:8], cwd=repo)
+    assert not launcher.is_version_checked_out(str(repo), head[:8])
+    assert launcher.is_version_checked_out(str(repo), head)
+
+
+def test_fetch_or_update_biobeamer_repo_config_failure_removes_clone(
+    monkeypatch, tmp_path
+):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    upstream = make_tagged_repo(tmp_path / "upstream")
+    real_run_git = launcher.run_git
+
+    def run_git_failing_config(args, repo_path=None, logger=None):
+        if args[0] == "config":
+            return subprocess.CompletedProcess(args, 1, None, "config failed")
+        return real_run_git(args, repo_path, logger=logger)
+
+    monkeypatch.setattr(launcher, "run_git", run_git_failing_config)
+    cache_dir = tmp_path / "cache"
+    assert (
+        launcher.fetch_or_update_biobeamer_repo(
+            upstream.as_uri(), "v1", str(cache_dir), logger=logger
+        )
+        is None
+    )
+    assert not (cache_dir / "BioBeamer").exists()
+
+
+def make_branched_upstream(path):
+    """Upstream with v1 <- v2 (tagged) on the default branch and a dev branch one commit past v2."""
+    upstream = make_tagged_repo(path)
+    git("commit", "-q", "--allow-empty", "-m", "v2", cwd=upstream)
+    git("tag", "v2", cwd=upstream)
+    git("checkout", "-q", "-b", "dev", cwd=upstream)
+    git("commit", "-q", "--allow-empty", "-m", "dev", cwd=upstream)
+    return upstream
+
+
+def test_fetch_or_update_biobeamer_repo_first_run_with_commit_hash(tmp_path, caplog):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    upstream = make_branched_upstream(tmp_path / "upstream")
+    sha = launcher.resolve_commit(str(upstream), "v1")
+    with caplog.at_level("INFO", logger="test_logger"):
+        repo_path = launcher.fetch_or_update_biobeamer_repo(
+            upstream.as_uri(), sha, str(tmp_path / "cache"), logger=logger
+        )
+    assert repo_path
+    assert "falling back to a full clone" in caplog.text
+    assert launcher.get_repo_head_sha(repo_path) == sha
+
+
+def test_fetch_or_update_biobeamer_repo_tag_clone_then_branch(tmp_path):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    upstream = make_branched_upstream(tmp_path / "upstream")
+    cache_dir = str(tmp_path / "cache")
+    repo_path = launcher.fetch_or_update_biobeamer_repo(
+        upstream.as_uri(), "v2", cache_dir, logger=logger
+    )
+    assert os.path.exists(os.path.join(repo_path, ".git", "shallow"))
+    assert launcher.fetch_or_update_biobeamer_repo(
+        upstream.as_uri(), "dev", cache_dir, logger=logger
+    )
+    assert launcher.get_repo_head_sha(repo_path) == launcher.resolve_commit(
+        str(upstream), "dev"
+    )
+
+
+def test_fetch_or_update_biobeamer_repo_shallow_cache_then_older_commit(tmp_path):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    upstream = make_branched_upstream(tmp_path / "upstream")
+    cache_dir = str(tmp_path / "cache")
+    for version in ("v2", "dev"):
+        repo_path = launcher.fetch_or_update_biobeamer_repo(
+            upstream.as_uri(), version, cache_dir, logger=logger
+        )
+    # v1 is older than anything in the shallow clone, so this must unshallow
+    sha = launcher.resolve_commit(str(upstream), "v1")
+    assert (
+        launcher.fetch_or_update_biobeamer_repo(
+            upstream.as_uri(), sha, cache_dir, logger=logger
+        )
+        == repo_path
+    )
+    assert not os.path.exists(os.path.join(repo_path, ".git", "shallow"))
+    assert launcher.get_repo_head_sha(repo_path) == sha
+
+
+def test_setup_biobeamer_venv_reinstalls_only_when_head_changes(monkeypatch, tmp_path):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger")
+    monkeypatch.setenv("BIOBEAMER_LAUNCHER_CACHE_DIR", str(tmp_path / "cache"))
+    venv_dir = tmp_path / "cache" / "BioBeamer-venv-v1"
+    head = {"sha": "a" * 40}
+    uv_calls = []
+
+    def fake_run(cmd, **kwargs):
+        uv_calls.append(cmd[1])
+        if cmd[1] == "venv":
+            # Stand-ins for what uv venv + pip install leave on either platform
+            for name in (
+                "bin/python",
+                "bin/biobeamer",
+                "Scripts/python.exe",
+                "Scripts/biobeamer.exe",
+            ):
+                (venv_dir / name).parent.mkdir(parents=True, exist_ok=True)
+                (venv_dir / name).touch()
+        return subprocess.CompletedProcess(cmd, 0, None, "")
+
+    monkeypatch.setattr(launcher, "find_uv_executable", lambda: "uv")
+    monkeypatch.setattr(launcher, "get_repo_head_sha", lambda repo_path: head["sha"])
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    installed_sha = venv_dir / ".installed_sha"
+
+    assert launcher.setup_biobeamer_venv("repo", "v1", logger)
+    assert uv_calls == ["venv", "pip"]
+    assert installed_sha.read_text() == "a" * 40
+    # (1) HEAD matches the recorded install: nothing to do
+    uv_calls.clear()
+    assert launcher.setup_biobeamer_venv("repo", "v1", logger)
+    assert uv_calls == []
+    # (2) HEAD moved: reinstall into the existing venv and record the new HEAD
+    head["sha"] = "b" * 40
+    assert launcher.setup_biobeamer_venv("repo", "v1", logger)
+    assert uv_calls == ["pip"]
+    assert installed_sha.read_text() == "b" * 40
+    # (3) A venv installed before .installed_sha existed is reinstalled once
+    installed_sha.unlink()
+    uv_calls.clear()
+    assert launcher.setup_biobeamer_venv("repo", "v1", logger)
+    assert launcher.setup_biobeamer_venv("repo", "v1", logger)
+    assert uv_calls == ["pip"]
+    assert installed_sha.read_text() == "b" * 40
+
+
+def test_get_logger_attaches_file_handler_later(tmp_path):
+    launcher = import_launcher()
+    logger = launcher.get_logger("test_logger_late_file")
+    launcher.get_logger("test_logger_late_file", log_dir=str(tmp_path))
+    launcher.attach_file_handler(logger, str(tmp_path))
+    file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+    assert [h.baseFilename for h in file_handlers] == [
+        str(tmp_path / "test_logger_late_file.log")
+    ]
+    for h in file_handlers:
+        logger.removeHandler(h)
+        h.close()
@@ -1,11 +1,15 @@
 import os
-import shutil
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 import pytest
-from conftest import make_dummy_biobeamer2_py, make_dummy_pyproject_toml
+from conftest import (
+    git,
+    link_or_copy,
+    make_dummy_biobeamer2_py,
+    make_dummy_pyproject_toml,
+)
 
 
 @pytest.mark.integration
@@ -24,21 +28,20 @@ def test_launcher_runs_biobeamer_and_copies_file(tmp_path, monkeypatch):
     make_dummy_biobeamer2_py(cli_py, variant="integration")
     # Git init and tag
     repo_root = repo_dir.parent
-    subprocess.run(["git", "init", "--initial-branch=main"], cwd=repo_root)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo_root)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_root)
+    git("init", "--initial-branch=main", cwd=repo_root)
     # Add minimal pyproject.toml so uv/pip can install the dummy package
     make_dummy_pyproject_toml(repo_root / "pyproject.toml")
     # Create __init__.py for the package
     (repo_dir / "__init__.py").write_text("")
-    subprocess.run(["git", "add", "pyproject.toml"], cwd=repo_root)
-    subprocess.run(["git", "add", "biobeamer/cli.py"], cwd=repo_root)
-    subprocess.run(["git", "add", "biobeamer/__init__.py"], cwd=repo_root)
-    subprocess.run(
-        ["git", "commit", "-m", "add dummy cli.py and pyproject.toml"],
+    git(
+        "add",
+        "pyproject.toml",
+        "biobeamer/cli.py",
+        "biobeamer/__init__.py",
         cwd=repo_root,
     )
-    subprocess.run(["git", "tag", "v1.0.0"], cwd=repo_root)
+    git("commit", "-m", "add dummy cli.py and pyproject.toml", cwd=repo_root)
+    git("tag", "v1.0.0", cwd=repo_root)
     # Write XML, XSD, input.txt
     xml_path = xml_dir / "BioBeamerTest.xml"
     xml_path.write_text(
@@ -53,14 +56,14 @@ def test_launcher_runs_biobeamer_and_copies_file(tmp_path, monkeypatch):
     ini = f"""[config]\nbiobeamer_repo_url = file://{repo_root}\nxml_file_path = {xml_path.resolve()}\nxsd_file_path = {xsd_path.resolve()}\nhost_name = testhost\n"""
     ini_path = config_dir / "launcher.ini"
     ini_path.write_text(ini)
-    # Copy launcher.py into place
+    # Link launcher.py into place
     # Place launcher.py at tmp_path/src/biobeamer_launcher/launcher.py so project root is tmp_path
     src_launcher = (
         Path(__file__).parent.parent / "src" / "biobeamer_launcher" / "launcher.py"
     )
     launcher_dest = tmp_path / "src" / "biobeamer_launcher"
     launcher_dest.mkdir(parents=True, exist_ok=True)
-    shutil.copy(src_launcher, launcher_dest / "launcher.py")
+    link_or_copy(src_launcher, launcher_dest / "launcher.py")
     # Set env for cache dir
     monkeypatch.setenv("BIOBEAMER_LAUNCHER_CACHE_DIR", str(tmp_path / "cache"))
     # Run launcher with no --config argument, so it uses the default config path logic
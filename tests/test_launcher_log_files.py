@@ -1,25 +1,24 @@
 import sys
-import shutil
 from pathlib import Path
 import re
 import pytest
-from conftest import make_dummy_biobeamer2_py, make_dummy_pyproject_toml
+from conftest import (
+    git,
+    link_or_copy,
+    make_dummy_biobeamer2_py,
+    make_dummy_pyproject_toml,
+)
+
+_BB_LOG_RE = re.compile(r"biobeamer_\d{8}_\d{6}\.log$")
 
 
 def test_launcher_log_files(tmp_path, monkeypatch):
     """
     Integration test: Check that all expected log files are created in the correct log directory.
     """
-    # Setup test file and config
-    test_file_name = "testfile_log_check.txt"
-    test_file_content = "log check content"
+    # The dummy BioBeamer only writes logs, so no source/target files are needed
     log_dir = tmp_path / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
-    src_path = Path("/tmp/tmpsykd339y")
-    tgt_path = Path("/tmp/tmphz8a5xe8")
-    src_path.mkdir(parents=True, exist_ok=True)
-    tgt_path.mkdir(parents=True, exist_ok=True)
-    (src_path / test_file_name).write_text(test_file_content)
 
     # Create dummy BioBeamer repo with script and pyproject.toml
     repo_dir = tmp_path / "biobeamer_repo" / "BioBeamer" / "src" / "biobeamer"
@@ -28,36 +27,38 @@ def test_launcher_log_files(tmp_path, monkeypatch):
     make_dummy_biobeamer2_py(cli_py, variant="log_files")
     repo_root = repo_dir.parent.parent
     make_dummy_pyproject_toml(repo_root / "pyproject.toml")
-    import subprocess
-
-    subprocess.run(["git", "init", "--initial-branch=main"], cwd=repo_root)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo_root)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_root)
+    git("init", "--initial-branch=main", cwd=repo_root)
     # Create __init__.py for the package
     (repo_dir / "__init__.py").write_text("")
-    subprocess.run(["git", "add", "pyproject.toml"], cwd=repo_root)
-    subprocess.run(["git", "add", "src/biobeamer/cli.py"], cwd=repo_root)
-    subprocess.run(["git", "add", "src/biobeamer/__init__.py"], cwd=repo_root)
-    subprocess.run(
-        ["git", "commit", "-m", "add dummy cli.py and pyproject.toml"],
+    git(
+        "add",
+        "pyproject.toml",
+        "src/biobeamer/cli.py",
+        "src/biobeamer/__init__.py",
         cwd=repo_root,
     )
-    subprocess.run(["git", "tag", "6-project-toml"], cwd=repo_root)
+    git("commit", "-m", "add dummy cli.py and pyproject.toml", cwd=repo_root)
+    git("tag", "6-project-toml", cwd=repo_root)
 
     # Write a minimal launcher.ini (after repo_root is defined)
     config_dir = tmp_path / "src" / "config"
     config_dir.mkdir(parents=True, exist_ok=True)
+    xml_path = tmp_path / "BioBeamerTest.xml"
+    xml_path.write_text(
+        '<BioBeamerHosts><host name="testhost_log_check" version="6-project-toml"/>'
+        "</BioBeamerHosts>"
+    )
     ini_path = config_dir / "launcher.ini"
     ini = f"""
 [config]
 biobeamer_repo_url = file://{repo_root}
-xml_file_path = https://github.com/fgcz/BioBeamerConfig/raw/main/xml/BioBeamerTest.xml
+xml_file_path = {xml_path}
 host_name = testhost_log_check
 log_dir = {log_dir}
 """
     ini_path.write_text(ini)
 
-    # Copy launcher.py to temp src
+    # Link launcher.py into temp src
     import os
 
     launcher_src = (
@@ -65,7 +66,7 @@ log_dir = {log_dir}
     )
     launcher_dest = tmp_path / "src" / "biobeamer_launcher"
     launcher_dest.mkdir(parents=True, exist_ok=True)
-    shutil.copy(launcher_src, launcher_dest / "launcher.py")
+    link_or_copy(launcher_src, launcher_dest / "launcher.py")
 
     monkeypatch.setenv("BIOBEAMER_LAUNCHER_CACHE_DIR", str(tmp_path / "cache"))
 
@@ -94,7 +95,7 @@ log_dir = {log_dir}
     ), f"Tool log missing in {log_names}"
     # BioBeamer log with date and time eg: biobeamer_20250610_101537.log
     assert any(
-        re.match(r"biobeamer_\d{8}_\d{6}\.log$", n) for n in log_names
+        _BB_LOG_RE.match(n) for n in log_names
     ), f"BioBeamer log missing in {log_names}"
     # biobeamer subprocess log
     assert any(
@@ -1,3 +1,4 @@
+import functools
 import shutil
 import subprocess
 import sys
@@ -5,6 +6,7 @@ import os
 from pathlib import Path
 
 import pytest
+from conftest import link_or_copy
 
 
 # Official URLs
@@ -28,30 +30,31 @@ def remote_biobeamer_target_dir(request):
     remote_host = getattr(request, "param", None) or "130.60.81.105"
     remote_user = "bfabriclocal"
     remote_tgt = "/tmp/biobeamer_tgt"
-    # Run mkdir -p and check for errors
-    mkdir_cmd = f"ssh {remote_user}@{remote_host} 'mkdir -p {remote_tgt}'"
-    mkdir_proc = subprocess.run(
-        mkdir_cmd, shell=True, capture_output=True, text=True, env=os.environ.copy()
-    )
-    if mkdir_proc.returncode != 0:
-        print(f"[remote_biobeamer_target_dir] mkdir failed: {mkdir_proc.stderr}")
+    # Create and open up the target dir in one ssh round trip
+    setup_cmd = [
+        "ssh",
+        f"{remote_user}@{remote_host}",
+        f"mkdir -p {remote_tgt} && chmod 777 {remote_tgt}",
+    ]
+    setup_proc = subprocess.run(setup_cmd, capture_output=True, text=True)
+    if setup_proc.returncode != 0:
+        print(f"[remote_biobeamer_target_dir] setup failed: {setup_proc.stderr}")
         raise RuntimeError(f"Failed to create remote directory: {remote_tgt}")
-    # Run chmod and check for errors
-    chmod_cmd = f"ssh {remote_user}@{remote_host} 'chmod 777 {remote_tgt}'"
-    chmod_proc = subprocess.run(
-        chmod_cmd, shell=True, capture_output=True, text=True, env=os.environ.copy()
-    )
-    if chmod_proc.returncode != 0:
-        print(f"[remote_biobeamer_target_dir] chmod failed: {chmod_proc.stderr}")
-        raise RuntimeError(f"Failed to chmod remote directory: {remote_tgt}")
     yield remote_tgt, remote_user, remote_host
-    cleanup_cmd = f"ssh {remote_user}@{remote_host} 'rm -rf {remote_tgt}/*'"
-    subprocess.run(cleanup_cmd, shell=True, env=os.environ.copy())
+    cleanup_cmd = ["ssh", f"{remote_user}@{remote_host}", f"rm -rf {remote_tgt}/*"]
+    subprocess.run(cleanup_cmd)
+
+
+@pytest.fixture(scope="module")
+def shared_biobeamer_cache(tmp_path_factory):
+    """Launcher cache shared by the tests in this module, so BioBeamer is cloned once."""
+    return tmp_path_factory.mktemp("biobeamer_cache")
 
 
 def run_real_launcher_test(
     tmp_path,
     monkeypatch,
+    cache_dir,
     host_name,
     test_file_name,
     test_file_content,
@@ -91,8 +94,8 @@ log_dir = {log_dir}
     )
     launcher_dest = tmp_path / "src" / "biobeamer_launcher"
     launcher_dest.mkdir(parents=True, exist_ok=True)
-    shutil.copy(src_launcher, launcher_dest / "launcher.py")
-    monkeypatch.setenv("BIOBEAMER_LAUNCHER_CACHE_DIR", str(tmp_path / "cache"))
+    link_or_copy(src_launcher, launcher_dest / "launcher.py")
+    monkeypatch.setenv("BIOBEAMER_LAUNCHER_CACHE_DIR", str(cache_dir))
     src_path.mkdir(parents=True, exist_ok=True)
     if check_target:
         tgt_path.mkdir(parents=True, exist_ok=True)
@@ -104,9 +107,7 @@ log_dir = {log_dir}
     ssh_auth_sock = os.environ.get("SSH_AUTH_SOCK")
     print(f"[DIAG] SSH_AUTH_SOCK in test environment: {ssh_auth_sock}")
     # Diagnostic: print ssh-add -l output from subprocess
-    agent_keys = subprocess.run(
-        ["ssh-add", "-l"], capture_output=True, text=True, env=os.environ.copy()
-    )
+    agent_keys = subprocess.run(["ssh-add", "-l"], capture_output=True, text=True)
     print(
         f"[DIAG] ssh-add -l output in test environment:\n{agent_keys.stdout}\n{agent_keys.stderr}"
     )
@@ -116,7 +117,6 @@ log_dir = {log_dir}
         capture_output=True,
         text=True,
         timeout=300,
-        env=os.environ.copy(),
     )
     print("STDOUT:\n", proc.stdout)
     print("STDERR:\n", proc.stderr)
@@ -135,13 +135,15 @@ log_dir = {log_dir}
                 else ("/tmp/biobeamer_tgt", "bfabriclocal", "130.60.81.105")
             )
             remote_file = f"{remote_tgt}/{test_file_name}"
-            check_cmd = f"ssh {remote_user}@{remote_host} 'test -f {remote_file} && cat {remote_file}'"
+            check_cmd = [
+                "ssh",
+                f"{remote_user}@{remote_host}",
+                f"test -f {remote_file} && cat {remote_file}",
+            ]
             result = subprocess.run(
                 check_cmd,
-                shell=True,
                 capture_output=True,
                 text=True,
-                env=os.environ.copy(),
             )
             assert (
                 result.returncode == 0
@@ -168,6 +170,7 @@ log_dir = {log_dir}
             pass
 
 
+@functools.lru_cache(maxsize=None)
 def is_tool_available(tool_name):
     """Check whether `tool_name` is on PATH and marked as executable."""
     from shutil import which
@@ -177,10 +180,11 @@ def is_tool_available(tool_name):
 
 @pytest.mark.real_integration
 @pytest.mark.skipif(not is_tool_available("scp"), reason="scp not available on system")
-def test_launcher_with_real_sources_scp(tmp_path, monkeypatch):
+def test_launcher_with_real_sources_scp(tmp_path, monkeypatch, shared_biobeamer_cache):
     run_real_launcher_test(
         tmp_path,
         monkeypatch,
+        shared_biobeamer_cache,
         host_name="testhost_real_integration_scp",
         test_file_name="testfile.txt",
         test_file_content="integration test file content",
@@ -192,10 +196,13 @@ def test_launcher_with_real_sources_scp(tmp_path, monkeypatch):
     not is_tool_available("robocopy.exe") and not is_tool_available("robocopy"),
     reason="robocopy not available on system",
 )
-def test_launcher_with_real_sources_robocopy(tmp_path, monkeypatch):
+def test_launcher_with_real_sources_robocopy(
+    tmp_path, monkeypatch, shared_biobeamer_cache
+):
     run_real_launcher_test(
         tmp_path,
         monkeypatch,
+        shared_biobeamer_cache,
         host_name="testhost_real_integration_robocopy",
         test_file_name="testfile_robocopy.txt",
         test_file_content="integration test file content robocopy",
@@ -205,11 +212,12 @@ def test_launcher_with_real_sources_robocopy(tmp_path, monkeypatch):
 @pytest.mark.real_integration
 @pytest.mark.skipif(not is_tool_available("scp"), reason="scp not available on system")
 def test_launcher_with_real_remote_scp(
-    tmp_path, monkeypatch, remote_biobeamer_target_dir
+    tmp_path, monkeypatch, remote_biobeamer_target_dir, shared_biobeamer_cache
 ):
     run_real_launcher_test(
         tmp_path,
         monkeypatch,
+        shared_biobeamer_cache,
         host_name="testhost_real_remote_scp",
         test_file_name="testfile_remote.txt",
         test_file_content="integration test file content remote scp",
@@ -1,13 +1,8 @@
 import os
-import tempfile
-import shutil
 import importlib.util
-from io import StringIO
-import sys
-import pytest
 
 
-def test_print_launcher_config_prints_expected(monkeypatch, tmp_path):
+def test_print_launcher_config_prints_expected(caplog):
     # Prepare a minimal config dict
     cfg = {
         "biobeamer_repo_url": "https://example.com/repo.git",
@@ -22,16 +17,9 @@ def test_print_launcher_config_prints_expected(monkeypatch, tmp_path):
     launcher = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(launcher)
     logger = launcher.get_logger("test_logger")
-    # Capture log output
-    import logging
-    from io import StringIO
-
-    log_stream = StringIO()
-    handler = logging.StreamHandler(log_stream)
-    logger.addHandler(handler)
-    launcher.print_launcher_config(cfg, logger=logger)
-    logger.removeHandler(handler)
-    output = log_stream.getvalue()
+    with caplog.at_level("INFO", logger="test_logger"):
+        launcher.print_launcher_config(cfg, logger=logger)
+    output = caplog.text
     assert "BioBeamerLauncher configuration:" in output
     assert "BioBeamer repo URL: https://example.com/repo.git" in output
     assert "Config file path: configs/BioBeamerTest.xml" in output